@@ -1,17 +1,83 @@
 import pandas as pd
 import numpy as np
 import datetime
-import uuid
+import sys
+from bisect import bisect_right
+from functools import lru_cache
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from time_utils import add_business_days
+from extension import ExtensionFactory
+
+
+# Display column names for an extension's actual-payments table, built
+# once instead of per show_extensions call
+_PAYMENT_DISPLAY_COLS = {
+    'payment_date': 'Date',
+    'payment_amount': 'Amount',
+    'principal_paid': 'Principal',
+    'interest_paid': 'Interest',
+    'remaining_balance': 'Remaining'
+}
+
+# Display column names for an extension's payment schedule; the raw
+# remaining_amount and paid columns are shown as-is
+_SCHEDULE_DISPLAY_COLS = {
+    'payment_number': 'Payment #',
+    'payment_date': 'Due Date',
+    'payment_amount': 'Amount',
+    'principal_amount': 'Principal',
+    'interest_amount': 'Interest',
+    'remaining_principal': 'Remaining Principal',
+    'remaining_interest': 'Remaining Interest'
+}
+
+# to_string formatters applied only at render time, so show_extensions
+# never builds formatted copies of the underlying frames
+_MONEY_FMT = '${:.2f}'.format
+_DATE_FMT = '{:%Y-%m-%d}'.format
+_SCHEDULE_FORMATTERS = {
+    'Due Date': _DATE_FMT, 'Amount': _MONEY_FMT, 'Principal': _MONEY_FMT,
+    'Interest': _MONEY_FMT, 'Remaining Principal': _MONEY_FMT,
+    'Remaining Interest': _MONEY_FMT
+}
+_PAYMENT_FORMATTERS = {
+    'Date': _DATE_FMT, 'Amount': _MONEY_FMT, 'Principal': _MONEY_FMT,
+    'Interest': _MONEY_FMT, 'Remaining': _MONEY_FMT
+}
+
+# Display order for same-day card events; unlisted events sort last
+_CARD_EVENT_RANK = {'NEW STATEMENT': 0, 'PAYMENT DUE': 1,
+                    'EXTENSION': 2, 'PAYMENT': 3, 'PURCHASE': 4}
+
+
+def _fmt_money(values):
+    """Format a numeric column as '$x.xx' strings in one vectorized pass."""
+    return np.char.add('$', np.char.mod(
+        '%.2f', np.asarray(values, dtype=np.float64)))
+
+
+def _fmt_date(values):
+    """Format a date column as 'YYYY-MM-DD' strings in one vectorized pass."""
+    values = pd.to_datetime(values)
+    if isinstance(values, pd.DatetimeIndex):
+        return values.strftime('%Y-%m-%d')
+    return values.dt.strftime('%Y-%m-%d')
 
 
 class Statement:
     @classmethod
+    @lru_cache(maxsize=256)
     def get_statement_cycles(cls, start_date, grace_period_days, cycle_count):
         """
         Calculate statement cycles based on start date and grace period.
 
+        Cached on its arguments (like add_business_days): statement rebuilds
+        keep asking for the same cycle runs, and the month-rolling loop plus
+        business-day walks need only run once per distinct run. Callers must
+        treat the returned list as read-only.
+
         Parameters:
         start_date (datetime): Starting date of first statement
         grace_period_days (int): Number of business days after statement end until due date
@@ -55,6 +121,32 @@ class Statement:
 
 
 class KeepCardSimulator:
+
+    # Sort priority for same-day transactions; unknown types sort last
+    TYPE_PRIORITY = {'EXTENSION': 0, 'PAYMENT': 1, 'PURCHASE': 2}
+
+    # Fixed vocabularies stored as categoricals: comparisons run on int8
+    # codes and each cell stops carrying a Python string
+    TYPE_DTYPE = pd.CategoricalDtype(
+        ['EXTENSION', 'PAYMENT', 'REFUND', 'PURCHASE', 'PAYMENT_REVERSAL'])
+    DIRECTION_DTYPE = pd.CategoricalDtype(['DEBIT', 'CREDIT'])
+
+    # Shared read-only sentinels returned while no data has materialized,
+    # so empty instances never allocate their own frames
+    _EMPTY_TRANSACTIONS = pd.DataFrame(columns=[
+        'id', 'type', 'type_priority', 'direction', 'amount', 'effective_date',
+        'created_at', 'balance'
+    ])
+    _EMPTY_STATEMENTS = pd.DataFrame(columns=[
+        'start_date', 'end_date', 'due_date', 'beginning_balance',
+        'ending_balance', 'purchases_amount', 'refunds_amount',
+        'payments_amount', 'extensions_amount', 'balance_due'
+    ])
+    _EMPTY_TIMELINE = pd.DataFrame(columns=[
+        'Date', 'Card Event', 'Card Details', 'Extension Event',
+        'Extension Details'
+    ])
+
     def __init__(self, statement_cycle_start=1):
         """
         Initialize the Keep Card simulator.
@@ -62,18 +154,191 @@ class KeepCardSimulator:
         Parameters:
         statement_cycle_start (int): Day of month when statement cycle starts (1-28 recommended)
         """
-        self.transactions = pd.DataFrame(columns=[
-            'id', 'type', 'direction', 'amount', 'effective_date', 'created_at', 'balance'
-        ])
-        self.statements = pd.DataFrame(columns=[
-            'start_date', 'end_date', 'due_date', 'beginning_balance',
-            'ending_balance', 'purchases_amount', 'refunds_amount', 'payments_amount',
-            'balance_due'
-        ])
+        self._transactions = None
+        self._statements = None
         self.statement_cycle_start = statement_cycle_start
 
+        # Pending transactions buffered as plain dicts; the DataFrame, running
+        # balance and statements are only rebuilt when a query method needs them.
+        self._tx_buffer = []
+        self._dirty = False
+        self._tx_counter = 0
+
+        # Statement rows kept between materializations so inserts that land in
+        # existing cycles only touch the affected cycles
+        self._statement_rows = []
+
+        # Sorted effective dates (as datetime64[D] for vectorized compares)
+        # and cumulative payment/extension credits, refreshed at
+        # materialization, for O(log N) date-range credit sums
+        self._effective_dates = np.array([], dtype='datetime64[D]')
+        self._credits_cum = np.array([])
+
+        # datetime64 mirror of the statements' start dates (frame order, so
+        # the trailing open statement keeps its place); comparisons against
+        # it vectorize while the user-facing column stays datetime.date
+        self._statement_starts = np.array([], dtype='datetime64[D]')
+
         self.extension_factory = ExtensionFactory()
 
+    @property
+    def transactions(self):
+        """Transaction ledger DataFrame, materialized from any pending inserts."""
+        self._materialize()
+        if self._transactions is None:
+            return self._EMPTY_TRANSACTIONS
+        return self._transactions
+
+    @property
+    def statements(self):
+        """Statements DataFrame, materialized from any pending inserts."""
+        self._materialize()
+        if self._statements is None:
+            return self._EMPTY_STATEMENTS
+        return self._statements
+
+    def _materialize(self):
+        """Flush buffered transactions into the ledger and recompute derived state.
+
+        Builds a single DataFrame from the buffered dicts, sorts once using an
+        integer type-priority column, then recalculates the running balance and
+        statements exactly once — instead of doing all of that per insert.
+        """
+        if not self._dirty:
+            return
+        self._dirty = False
+
+        new_dates = [tx['effective_date'] for tx in self._tx_buffer]
+        new_transactions = pd.DataFrame(self._tx_buffer)
+        self._tx_buffer = []
+
+        # Earliest date known before this batch; the ledger is date-sorted,
+        # so it is the first row. Used to decide whether the cached
+        # statements can absorb the batch incrementally.
+        prev_min_date = None
+        if self._transactions is not None and len(self._transactions):
+            prev_min_date = self._transactions['effective_date'].iloc[0]
+
+        if self._transactions is None:
+            combined = new_transactions
+        else:
+            combined = pd.concat(
+                [self._transactions, new_transactions], ignore_index=True)
+
+        combined = combined.sort_values(
+            by=['effective_date', 'type_priority'], kind='stable')
+        combined = combined.reset_index(drop=True)
+
+        # Keep amount as float64 so downstream .values access is a zero-copy view
+        combined['amount'] = combined['amount'].astype(np.float64)
+        combined['type'] = combined['type'].astype(self.TYPE_DTYPE)
+        combined['direction'] = combined['direction'].astype(
+            self.DIRECTION_DTYPE)
+
+        self._transactions = combined
+
+        # datetime64 mirror of the sorted effective dates; comparisons against
+        # it are int64 ops instead of per-object date comparisons
+        self._effective_dates = combined['effective_date'].to_numpy().astype(
+            'datetime64[D]')
+        self._credits_cum = np.where(
+            combined['type'].isin(['PAYMENT', 'EXTENSION']).to_numpy(),
+            combined['amount'].to_numpy(), 0.0).cumsum()
+
+        # Recalculate running balance and statements once for the whole batch;
+        # rows before the earliest inserted date kept their order (stable
+        # sort), so their balances are still valid and the cumsum restarts at
+        # the first affected row. Inserts that land inside already-generated
+        # cycles likewise only update those cycles.
+        balance_start = np.searchsorted(
+            self._effective_dates, np.datetime64(min(new_dates)), side='left')
+        self._recalculate_balance(start_idx=int(balance_start))
+        if not self._update_statements_incremental(new_dates, prev_min_date):
+            self._generate_statements()
+
+    def _update_statements_incremental(self, new_dates, prev_min_date):
+        """Refresh only the statement cycles touched by the given dates.
+
+        Returns False when the cached statement rows cannot absorb the new
+        transactions (no statements yet, a date falls outside the existing
+        closed cycles, or a date precedes the previously earliest
+        transaction) and a full regeneration is required.
+        """
+        if not self._statement_rows or not new_dates:
+            return False
+
+        # The cycle anchor is derived from the earliest transaction's month,
+        # so a new minimum can shift the whole statement layout (e.g. add a
+        # leading empty cycle) even when the date lands inside an existing
+        # closed cycle — only a full rebuild reflects that
+        if prev_min_date is None or min(new_dates) < prev_min_date:
+            return False
+
+        # The last cached row is the open statement; the rest are closed cycles
+        closed_rows = self._statement_rows[:-1]
+        if not closed_rows:
+            return False
+
+        cycle_starts = [row['start_date'] for row in closed_rows]
+
+        affected = set()
+        for date in new_dates:
+            cycle_idx = bisect_right(cycle_starts, date) - 1
+            if cycle_idx < 0 or date > closed_rows[cycle_idx]['end_date']:
+                return False
+            affected.add(cycle_idx)
+
+        # Refresh the transaction slice for every closed cycle from the
+        # earliest affected one onward — the balance recalculation rewrote
+        # the ledger's balance column from the insertion point, so later
+        # cycles' cached slices are stale even when their totals are not.
+        # Each slice is two binary searches on the date-sorted ledger.
+        for cycle_idx in range(min(affected), len(closed_rows)):
+            row = closed_rows[cycle_idx]
+            lo = np.searchsorted(
+                self._effective_dates, np.datetime64(row['start_date']),
+                side='left')
+            hi = np.searchsorted(
+                self._effective_dates, np.datetime64(row['end_date']),
+                side='right')
+            stmt_transactions = self._transactions.iloc[lo:hi]
+            row['transactions'] = stmt_transactions
+
+            # Totals only change for the cycles the new dates landed in
+            if cycle_idx not in affected:
+                continue
+            # Total per type through the same groupby kernel the full rebuild
+            # uses, so both paths accumulate the floats in the same order and
+            # produce bit-identical statements
+            totals = stmt_transactions.groupby(
+                'type', sort=False, observed=True)['amount'].sum().reindex(
+                ['PURCHASE', 'REFUND', 'PAYMENT', 'EXTENSION'], fill_value=0.0)
+            row['purchases_amount'] = totals['PURCHASE']
+            row['refunds_amount'] = totals['REFUND']
+            row['payments_amount'] = totals['PAYMENT']
+            row['extensions_amount'] = totals['EXTENSION']
+
+        # Propagate balances forward through the closed cycles
+        running_balance = closed_rows[0]['beginning_balance']
+        for row in closed_rows:
+            row['beginning_balance'] = running_balance
+            row['ending_balance'] = running_balance + row['purchases_amount'] - \
+                row['refunds_amount'] - row['payments_amount'] - \
+                row['extensions_amount']
+            running_balance = row['ending_balance']
+
+        open_row = self._statement_rows[-1]
+        open_row['beginning_balance'] = running_balance
+
+        for i in range(1, len(self._statement_rows)):
+            row = self._statement_rows[i]
+            row['balance_due'] = 0 if row['beginning_balance'] < 0 else row['beginning_balance']
+
+        self._statements = pd.DataFrame(self._statement_rows)
+        self._statement_starts = self._statements['start_date'].to_numpy().astype(
+            'datetime64[D]')
+        return True
+
     def add_transaction(self, transaction_type, amount, effective_date=None, created_at=None):
         """
         Add a single transaction to the system.
@@ -83,9 +348,6 @@ class KeepCardSimulator:
         amount (float): Amount of the transaction
         effective_date (str or datetime): Date when transaction is effective (default: today)
         created_at (str or datetime): Date when transaction is created (default: today)
-
-        Returns:
-        DataFrame: Updated transactions DataFrame
         """
         if effective_date is None:
             effective_date = datetime.date.today()
@@ -107,34 +369,20 @@ class KeepCardSimulator:
         else:
             direction = 'DEBIT'
 
-        # Create new transaction
-        new_transaction = pd.DataFrame({
-            'id': [str(uuid.uuid4())],
-            'type': [transaction_type],
-            'direction': [direction],
-            'amount': [float(amount)],
-            'effective_date': [effective_date],
-            'created_at': [created_at],
-            'balance': [0.0]  # Placeholder, will be calculated
+        # Buffer the transaction; balance and statements are rebuilt lazily
+        self._tx_counter += 1
+        self._tx_buffer.append({
+            'id': f"TX-{self._tx_counter:010d}",
+            'type': transaction_type,
+            'type_priority': self.TYPE_PRIORITY.get(
+                transaction_type, len(self.TYPE_PRIORITY)),
+            'direction': direction,
+            'amount': float(amount),
+            'effective_date': effective_date,
+            'created_at': created_at,
+            'balance': 0.0  # Placeholder, will be calculated
         })
-
-        # Add to transactions and sort by effective date
-        self.transactions = pd.concat(
-            [self.transactions, new_transaction], ignore_index=True)
-        self.transactions = self.transactions.sort_values(
-            by=['effective_date', 'type'],
-            ascending=[True, True],
-            key=lambda x: pd.Categorical(x, categories=[
-                                         'EXTENSION', 'PAYMENT', 'PURCHASE'], ordered=True) if x.name == 'type' else x
-        )
-
-        # Recalculate running balance
-        self._recalculate_balance()
-
-        # Generate statements
-        self._generate_statements()
-
-        return self.transactions
+        self._dirty = True
 
     def create_statement_extension(self, amount, effective_date, term_months=12, apr=36.0):
         """
@@ -186,11 +434,7 @@ class KeepCardSimulator:
                     payment_date, '%Y-%m-%d').date()
 
         # Find the extension
-        extension = None
-        for ext in self.extension_factory.extensions:
-            if ext.extension_id == extension_id:
-                extension = ext
-                break
+        extension = self.extension_factory.get_extension(extension_id)
 
         if extension is None:
             print(f"Extension {extension_id} not found")
@@ -199,6 +443,49 @@ class KeepCardSimulator:
         # Make the payment
         return extension.make_payment(amount, payment_date)
 
+    def batch_extension_payments(self, payments):
+        """
+        Process a batch of extension payments, parallelizing across extensions.
+
+        Payments to the same extension are applied sequentially in input
+        order; different extensions share no state, so their payment runs are
+        dispatched to a thread pool.
+
+        Parameters:
+        payments (list[tuple]): (extension_id, amount, payment_date) triples
+
+        Returns:
+        list: Payment details per input entry, in input order (None where the
+        extension was not found)
+        """
+        results = [None] * len(payments)
+
+        # Group entries by extension so each worker owns one extension
+        groups = {}
+        for position, (extension_id, amount, payment_date) in enumerate(payments):
+            if isinstance(payment_date, str):
+                payment_date = datetime.datetime.strptime(
+                    payment_date, '%Y-%m-%d').date()
+            groups.setdefault(extension_id, []).append(
+                (position, amount, payment_date))
+
+        def process_group(extension_id, entries):
+            extension = self.extension_factory.get_extension(extension_id)
+            if extension is None:
+                print(f"Extension {extension_id} not found")
+                return
+            for position, amount, payment_date in entries:
+                results[position] = extension.make_payment(
+                    amount, payment_date)
+
+        with ThreadPoolExecutor() as executor:
+            futures = [executor.submit(process_group, extension_id, entries)
+                       for extension_id, entries in groups.items()]
+            for future in futures:
+                future.result()
+
+        return results
+
     def generate_bulk_transactions(self, num_purchases=0, avg_purchase_amount=50,
                                    num_refunds=0, avg_refund_amount=25,
                                    num_payments=0, avg_payment_amount=100,
@@ -233,70 +520,78 @@ class KeepCardSimulator:
         elif isinstance(end_date, str):
             end_date = datetime.datetime.strptime(end_date, '%Y-%m-%d').date()
 
-        # Generate purchases
-        for _ in range(num_purchases):
-            if randomize:
-                amount = np.random.uniform(0.1, avg_purchase_amount * 2)
-                days_between = (end_date - start_date).days
-                random_days = int(np.random.random() * days_between)
-                date = start_date + timedelta(days=random_days)
-            else:
-                amount = avg_purchase_amount
-                days_between = (end_date - start_date).days
-                day_increment = max(1, days_between //
-                                    num_purchases) if num_purchases > 0 else 1
-                date = start_date + timedelta(days=_ * day_increment)
-
-            self.add_transaction('PURCHASE', amount, date, date)
-
-        # Generate refunds
-        for _ in range(num_refunds):
-            if randomize:
-                amount = np.random.uniform(0.1, avg_refund_amount * 2)
-                days_between = (end_date - start_date).days
-                random_days = int(np.random.random() * days_between)
-                date = start_date + timedelta(days=random_days)
-            else:
-                amount = avg_refund_amount
-                days_between = (end_date - start_date).days
-                day_increment = max(1, days_between //
-                                    num_refunds) if num_refunds > 0 else 1
-                date = start_date + timedelta(days=_ * day_increment)
-
-            self.add_transaction('REFUND', amount, date, date)
-
-        # Generate payments
-        for _ in range(num_payments):
-            if randomize:
-                amount = np.random.uniform(0.1, avg_payment_amount * 2)
-                days_between = (end_date - start_date).days
-                random_days = int(np.random.random() * days_between)
-                date = start_date + timedelta(days=random_days)
-            else:
-                amount = avg_payment_amount
-                days_between = (end_date - start_date).days
-                day_increment = max(1, days_between //
-                                    num_payments) if num_payments > 0 else 1
-                date = start_date + timedelta(days=_ * day_increment)
-
-            self.add_transaction('PAYMENT', amount, date, date)
+        self._bulk_add('PURCHASE', num_purchases, avg_purchase_amount,
+                       start_date, end_date, randomize)
+        self._bulk_add('REFUND', num_refunds, avg_refund_amount,
+                       start_date, end_date, randomize)
+        self._bulk_add('PAYMENT', num_payments, avg_payment_amount,
+                       start_date, end_date, randomize)
 
         return self.transactions
 
-    def _recalculate_balance(self):
-        """Recalculate the running balance for all transactions."""
-        if self.transactions.empty:
+    def _bulk_add(self, transaction_type, count, avg_amount, start_date, end_date, randomize):
+        """Buffer `count` transactions of one type with vectorized draws.
+
+        Amounts and day offsets come from single NumPy calls instead of one
+        RNG draw per transaction; the rows then go straight into the buffer
+        and are materialized once by the caller.
+        """
+        if count <= 0:
             return
 
-        balance = 0.0
-        for idx in self.transactions.index:
-            transaction = self.transactions.loc[idx]
-            if transaction['direction'] == 'DEBIT':
-                balance += transaction['amount']
-            else:  # CREDIT
-                balance -= transaction['amount']
+        days_between = (end_date - start_date).days
+        if randomize:
+            amounts = np.random.uniform(0.1, avg_amount * 2, size=count)
+            day_offsets = (np.random.random(size=count) *
+                           days_between).astype(int)
+        else:
+            amounts = np.full(count, float(avg_amount))
+            day_increment = max(1, days_between // count)
+            day_offsets = np.arange(count) * day_increment
+
+        if transaction_type in ['PAYMENT', 'REFUND', 'EXTENSION']:
+            direction = 'CREDIT'
+        else:
+            direction = 'DEBIT'
+        type_priority = self.TYPE_PRIORITY.get(
+            transaction_type, len(self.TYPE_PRIORITY))
+
+        for amount, day_offset in zip(amounts.tolist(), day_offsets.tolist()):
+            date = start_date + timedelta(days=day_offset)
+            self._tx_counter += 1
+            self._tx_buffer.append({
+                'id': f"TX-{self._tx_counter:010d}",
+                'type': transaction_type,
+                'type_priority': type_priority,
+                'direction': direction,
+                'amount': amount,
+                'effective_date': date,
+                'created_at': date,
+                'balance': 0.0  # Placeholder, will be calculated
+            })
+        self._dirty = True
+
+    def _recalculate_balance(self, start_idx=0):
+        """Recalculate the running balance from `start_idx` onwards.
 
-            self.transactions.loc[idx, 'balance'] = balance
+        Rows before `start_idx` are unchanged by the latest batch, so their
+        balances are reused and only the tail cumsum is recomputed.
+        """
+
+        # Signed amounts (debits positive, credits negative) accumulated in one
+        # vectorized pass instead of per-row .loc reads and writes
+        signs = np.where(
+            self._transactions['direction'].values == 'DEBIT', 1.0, -1.0)
+        amounts = self._transactions['amount'].values
+
+        if start_idx <= 0:
+            self._transactions['balance'] = (signs * amounts).cumsum()
+            return
+
+        balance = self._transactions['balance'].to_numpy(copy=True)
+        balance[start_idx:] = balance[start_idx - 1] + \
+            (signs[start_idx:] * amounts[start_idx:]).cumsum()
+        self._transactions['balance'] = balance
 
     def _calculate_balance_due(self, current_stmt_idx, prev_stmt_idx=None):
         """
@@ -322,12 +617,18 @@ class KeepCardSimulator:
         current_stmt = self.statements.iloc[current_stmt_idx]
         current_start_date = current_stmt['start_date']
 
-        # Find all payments and extensions made between previous due date and current statement start
-        credits_after_due_date = self.transactions[
-            ((self.transactions['type'] == 'PAYMENT') | (self.transactions['type'] == 'EXTENSION')) &
-            (self.transactions['effective_date'] <= current_start_date) &
-            (self.transactions['effective_date'] > prev_due_date)
-        ]['amount'].sum()
+        # Sum payments and extensions made between previous due date and
+        # current statement start from the precomputed credits cumsum
+        self._materialize()
+        hi = np.searchsorted(
+            self._effective_dates, np.datetime64(current_start_date), side='right')
+        lo = np.searchsorted(
+            self._effective_dates, np.datetime64(prev_due_date), side='right')
+        if hi == 0:
+            credits_after_due_date = 0.0
+        else:
+            credits_after_due_date = self._credits_cum[hi - 1] - \
+                (self._credits_cum[lo - 1] if lo else 0.0)
 
         # Subtract payments and extensions from previous balance
         balance_due = max(0, prev_end_balance - credits_after_due_date)
@@ -336,40 +637,23 @@ class KeepCardSimulator:
 
     def _generate_statements(self):
         """Generate statements based on transactions."""
-        if self.transactions.empty:
-            self.statements = pd.DataFrame(columns=[
-                'start_date', 'end_date', 'due_date', 'beginning_balance',
-                'ending_balance', 'purchases_amount', 'refunds_amount',
-                'payments_amount', 'balance_due', 'extensions_amount'
-            ])
+        if self._transactions is None or self._transactions.empty:
+            self._statement_rows = []
+            self._statements = None
+            self._statement_starts = np.array([], dtype='datetime64[D]')
             return
 
         # Get date range from first to last transaction
-        min_date = self.transactions['effective_date'].min()
-        max_date = self.transactions['effective_date'].max()
-
-        # Start from the first cycle that would include the first transaction
-        if min_date.day < self.statement_cycle_start:
-            # Current month's cycle already started
-            current_start = datetime.date(
-                min_date.year, min_date.month, self.statement_cycle_start)
-        else:
-            # Need to go to previous month's cycle
-            if min_date.month == 1:
-                current_start = datetime.date(
-                    min_date.year - 1, 12, self.statement_cycle_start)
-            else:
-                current_start = datetime.date(
-                    min_date.year, min_date.month - 1, self.statement_cycle_start)
+        min_date = self._transactions['effective_date'].min()
+        max_date = self._transactions['effective_date'].max()
 
-        # If current_start is after min_date, go back one more month
-        if current_start > min_date:
-            if current_start.month == 1:
-                current_start = datetime.date(
-                    current_start.year - 1, 12, self.statement_cycle_start)
-            else:
-                current_start = datetime.date(
-                    current_start.year, current_start.month - 1, self.statement_cycle_start)
+        # Anchor on the month before the first transaction's month: the old
+        # two-step rollback (pick a candidate month, then step back when the
+        # candidate lands after min_date) always ended up there, so a single
+        # integer month subtraction replaces the branchy date constructions
+        anchor_ym = min_date.year * 12 + (min_date.month - 1) - 1
+        current_start = datetime.date(
+            anchor_ym // 12, anchor_ym % 12 + 1, self.statement_cycle_start)
 
         statement_list = []
 
@@ -381,38 +665,57 @@ class KeepCardSimulator:
         statement_cycles = Statement.get_statement_cycles(
             current_start, 1, months_between)
 
+        # Bucket every transaction into its cycle once and total per
+        # (cycle, type) in a single groupby pass, instead of four boolean-mask
+        # scans of the slice per cycle
+        cycle_start_dates = np.array(
+            [cycle[0] for cycle in statement_cycles], dtype='datetime64[D]')
+        cycle_ids = np.searchsorted(
+            cycle_start_dates, self._effective_dates, side='right') - 1
+        # Each cycle's transactions form a contiguous run of the date-sorted
+        # ledger; precompute the slice boundaries once
+        cycle_bounds = np.searchsorted(
+            self._effective_dates, cycle_start_dates, side='left')
+        cycle_totals = self._transactions.groupby(
+            [cycle_ids, 'type'], sort=False)['amount'].sum().unstack(fill_value=0.0)
+        cycle_totals = cycle_totals.reindex(
+            columns=['PURCHASE', 'REFUND', 'PAYMENT', 'EXTENSION'], fill_value=0.0)
+
         # Generate statements for each cycle
-        for cycle_start, cycle_end, cycle_due in statement_cycles:
+        for cycle_idx, (cycle_start, cycle_end, cycle_due) in enumerate(statement_cycles):
             # Stop if we've gone past max_date
             if cycle_start > max_date:
                 break
 
-            # Find transactions in this statement period
-            stmt_transactions = self.transactions[
-                (self.transactions['effective_date'] >= cycle_start) &
-                (self.transactions['effective_date'] <= cycle_end)
-            ]
-
-            # Calculate statement totals
-            purchases_amount = stmt_transactions[stmt_transactions['type'] == 'PURCHASE']['amount'].sum(
-            )
-            refunds_amount = stmt_transactions[stmt_transactions['type'] == 'REFUND']['amount'].sum(
-            )
-            payments_amount = stmt_transactions[stmt_transactions['type'] == 'PAYMENT']['amount'].sum(
-            )
-            extensions_amount = stmt_transactions[stmt_transactions['type'] == 'EXTENSION']['amount'].sum(
-            )
+            # Find transactions in this statement period (zero-copy slice of
+            # the sorted ledger instead of a boolean mask per cycle)
+            slice_lo = cycle_bounds[cycle_idx]
+            slice_hi = cycle_bounds[cycle_idx + 1] if cycle_idx + \
+                1 < len(cycle_bounds) else len(self._transactions)
+            stmt_transactions = self._transactions.iloc[slice_lo:slice_hi]
+
+            # Read the statement totals off the precomputed table
+            if cycle_idx in cycle_totals.index:
+                totals = cycle_totals.loc[cycle_idx]
+                purchases_amount = totals['PURCHASE']
+                refunds_amount = totals['REFUND']
+                payments_amount = totals['PAYMENT']
+                extensions_amount = totals['EXTENSION']
+            else:
+                purchases_amount = refunds_amount = 0.0
+                payments_amount = extensions_amount = 0.0
 
             # Beginning and ending balance
             if statement_list:
                 beginning_balance = statement_list[-1]['ending_balance']
             else:
                 # For first statement, get balance before first transaction in period
-                txs_before_period = self.transactions[self.transactions['effective_date'] < cycle_start]
-                if txs_before_period.empty:
+                before_period = np.searchsorted(
+                    self._effective_dates, np.datetime64(cycle_start), side='left')
+                if before_period == 0:
                     beginning_balance = 0.0
                 else:
-                    beginning_balance = txs_before_period.iloc[-1]['balance']
+                    beginning_balance = self._transactions['balance'].iloc[before_period - 1]
 
             ending_balance = beginning_balance + purchases_amount - \
                 refunds_amount - payments_amount - extensions_amount
@@ -437,23 +740,10 @@ class KeepCardSimulator:
 
         # Add next open statement
         if statement_list:
-            next_start = current_start
-            if next_start.month == 12:
-                next_end = datetime.date(
-                    next_start.year + 1, 1, self.statement_cycle_start) - timedelta(days=1)
-            else:
-                try:
-                    next_end = datetime.date(
-                        next_start.year, next_start.month + 1, self.statement_cycle_start) - timedelta(days=1)
-                except ValueError:
-                    if next_start.month == 12:
-                        next_end = datetime.date(
-                            next_start.year + 1, 1, 1) - timedelta(days=1)
-                    else:
-                        next_end = datetime.date(
-                            next_start.year, next_start.month + 2, 1) - timedelta(days=1)
-
-            next_due_date = add_business_days(next_end, 1)
+            # The open statement spans current_start plus one month with a
+            # one-business-day grace period — exactly the first precomputed
+            # cycle, so reuse it instead of re-deriving the dates
+            next_start, next_end, next_due_date = statement_cycles[0]
 
             statement_list.append({
                 'start_date': next_start,
@@ -469,27 +759,31 @@ class KeepCardSimulator:
                 'transactions': pd.DataFrame()
             })
 
-        # Create statements dataframe
-        self.statements = pd.DataFrame(statement_list)
+        # Create statements dataframe and keep the rows for incremental updates
+        self._statement_rows = statement_list
+        self._statements = pd.DataFrame(statement_list)
+        self._statement_starts = self._statements['start_date'].to_numpy().astype(
+            'datetime64[D]')
 
         # Now update the balance_due for each statement
-        for i in range(len(self.statements)):
+        for i in range(len(self._statements)):
             prev_idx = i - 1
             if prev_idx >= 0:
-                self.statements.loc[i,
-                                    'balance_due'] = 0 if self.statements.loc[i, 'beginning_balance'] < 0 else self.statements.loc[i, 'beginning_balance']
+                self._statements.loc[i,
+                                    'balance_due'] = 0 if self._statements.loc[i, 'beginning_balance'] < 0 else self._statements.loc[i, 'beginning_balance']
 
     def reset(self):
         """Reset all data in the simulator."""
-        self.transactions = pd.DataFrame(columns=[
-            'id', 'type', 'direction', 'amount', 'effective_date', 'created_at', 'balance'
-        ])
-        self.statements = pd.DataFrame(columns=[
-            'start_date', 'end_date', 'due_date', 'beginning_balance',
-            'ending_balance', 'purchases_amount', 'refunds_amount',
-            'payments_amount', 'extensions_amount', 'balance_due'
-        ])
-        self.extension_factory.extensions = []
+        self._tx_buffer = []
+        self._dirty = False
+        self._tx_counter = 0
+        self._statement_rows = []
+        self._transactions = None
+        self._statements = None
+        self._effective_dates = np.array([], dtype='datetime64[D]')
+        self._credits_cum = np.array([])
+        self._statement_starts = np.array([], dtype='datetime64[D]')
+        self.extension_factory = ExtensionFactory()
 
     def show_transactions(self):
         """Display the transaction ledger with formatted values."""
@@ -497,22 +791,18 @@ class KeepCardSimulator:
             print("No transactions available.")
             return
 
-        # Make a copy for display formatting
-        display_df = self.transactions.copy()
-
-        # Format currency columns
-        display_df['amount'] = display_df['amount'].apply(
-            lambda x: f"${x:.2f}")
-        display_df['balance'] = display_df['balance'].apply(
-            lambda x: f"${x:.2f}")
-
-        # Format dates - ensure they're properly formatted as strings
-        display_df['effective_date'] = display_df['effective_date'].apply(
-            lambda x: x.strftime('%Y-%m-%d') if hasattr(x, 'strftime') else str(x))
-
-        # Reorder and select columns for display
-        columns = ['effective_date', 'type', 'direction', 'amount', 'balance']
-        print(display_df[columns].to_string(index=False))
+        # Build the display frame column-by-column instead of copying the
+        # ledger; currency and date formatting run as vectorized kernels
+        # rather than a Python lambda per cell
+        transactions = self.transactions
+        display_df = pd.DataFrame({
+            'effective_date': _fmt_date(transactions['effective_date']),
+            'type': transactions['type'],
+            'direction': transactions['direction'],
+            'amount': np.char.mod('$%.2f', transactions['amount'].to_numpy()),
+            'balance': np.char.mod('$%.2f', transactions['balance'].to_numpy()),
+        })
+        print(display_df.to_string(index=False))
 
     def show_statements(self, include_transactions=False):
         """
@@ -525,40 +815,47 @@ class KeepCardSimulator:
             print("No statements available.")
             return
 
-        for idx, stmt in self.statements.iterrows():
-            print(f"Statement {idx+1}:")
-            start_date_str = stmt['start_date'].strftime(
-                '%Y-%m-%d') if hasattr(stmt['start_date'], 'strftime') else str(stmt['start_date'])
-            end_date_str = stmt['end_date'].strftime(
-                '%Y-%m-%d') if hasattr(stmt['end_date'], 'strftime') else str(stmt['end_date'])
-            due_date_str = stmt['due_date'].strftime(
-                '%Y-%m-%d') if hasattr(stmt['due_date'], 'strftime') else str(stmt['due_date'])
-
-            print(f"Period: {start_date_str} to {end_date_str}")
-            print(f"Due Date: {due_date_str}")
-            print(
-                f"Balance Due (from previous statement): ${stmt['balance_due']:.2f}")
-            print(f"Beginning Balance: ${stmt['beginning_balance']:.2f}")
-            print(f"Purchases: ${stmt['purchases_amount']:.2f}")
-            print(f"Refunds: ${stmt['refunds_amount']:.2f}")
-            print(f"Payments: ${stmt['payments_amount']:.2f}")
-            if 'extensions_amount' in stmt and stmt['extensions_amount'] > 0:
-                print(f"Extensions: ${stmt['extensions_amount']:.2f}")
-            print(f"Ending Balance: ${stmt['ending_balance']:.2f}")
-
-            if include_transactions and 'transactions' in stmt and not stmt['transactions'].empty:
-                print("\nTransactions in this statement:")
-                display_txs = stmt['transactions'].copy()
-                display_txs['amount'] = display_txs['amount'].apply(
-                    lambda x: f"${x:.2f}")
-                display_txs['balance'] = display_txs['balance'].apply(
-                    lambda x: f"${x:.2f}")
-                display_txs['effective_date'] = display_txs['effective_date'].apply(
-                    lambda x: x.strftime('%Y-%m-%d') if hasattr(x, 'strftime') else str(x))
-                print(display_txs[['effective_date', 'type',
-                      'amount', 'balance']].to_string(index=False))
-
-            print("\n" + "-"*50 + "\n")
+        # Format all date columns in one vectorized pass instead of a
+        # per-row strftime with a hasattr probe per cell
+        start_strs = _fmt_date(self.statements['start_date'])
+        end_strs = _fmt_date(self.statements['end_date'])
+        due_strs = _fmt_date(self.statements['due_date'])
+
+        # Accumulate the report and write it in one go instead of dozens of
+        # print calls per statement
+        out = []
+
+        # itertuples hands back plain tuples instead of boxing a Series per row
+        for idx, stmt in enumerate(self.statements.itertuples(index=False)):
+            out.append(f"Statement {idx+1}:")
+            start_date_str = start_strs.iloc[idx]
+            end_date_str = end_strs.iloc[idx]
+            due_date_str = due_strs.iloc[idx]
+
+            out.append(f"Period: {start_date_str} to {end_date_str}")
+            out.append(f"Due Date: {due_date_str}")
+            out.append(
+                f"Balance Due (from previous statement): ${stmt.balance_due:.2f}")
+            out.append(f"Beginning Balance: ${stmt.beginning_balance:.2f}")
+            out.append(f"Purchases: ${stmt.purchases_amount:.2f}")
+            out.append(f"Refunds: ${stmt.refunds_amount:.2f}")
+            out.append(f"Payments: ${stmt.payments_amount:.2f}")
+            if hasattr(stmt, 'extensions_amount') and stmt.extensions_amount > 0:
+                out.append(f"Extensions: ${stmt.extensions_amount:.2f}")
+            out.append(f"Ending Balance: ${stmt.ending_balance:.2f}")
+
+            if include_transactions and hasattr(stmt, 'transactions') and not stmt.transactions.empty:
+                out.append("\nTransactions in this statement:")
+                display_txs = stmt.transactions.copy()
+                display_txs['amount'] = _fmt_money(display_txs['amount'])
+                display_txs['balance'] = _fmt_money(display_txs['balance'])
+                display_txs['effective_date'] = _fmt_date(display_txs['effective_date'])
+                out.append(display_txs[['effective_date', 'type',
+                           'amount', 'balance']].to_string(index=False))
+
+            out.append("\n" + "-"*50 + "\n")
+
+        sys.stdout.write('\n'.join(out) + '\n')
 
     def calculate_period_balance_due(self, date):
         """
@@ -577,35 +874,37 @@ class KeepCardSimulator:
         if self.statements.empty:
             return 0.0
 
-        # Find most recent statement before the given date
-        past_stmt = self.statements[self.statements['start_date'] <= date]
+        # Find most recent statement before the given date; the comparison
+        # runs on the datetime64 mirror instead of the object-dtype column.
+        # Start dates are not sorted (the trailing open statement reuses the
+        # first cycle start), so take the last matching frame index and read
+        # the two needed scalars instead of slicing a one-row DataFrame.
+        matches = np.flatnonzero(
+            self._statement_starts <= np.datetime64(date))
 
-        if past_stmt.empty:
+        if matches.size == 0:
             return 0.0
 
-        # Get the most recent statement by taking the last row
-        current_stmt = past_stmt.iloc[-1:]
-
-        # Get beginning balance of most recent past statement
-        balance_due = float(current_stmt.iloc[0]['balance_due'])
-
-        # Get all PAYMENT and EXTENSION transactions up to given date
-        relevant_txns = self.transactions[
-            ((self.transactions['type'] == 'PAYMENT') |
-             (self.transactions['type'] == 'EXTENSION')) &
-            (self.transactions['effective_date'] <= date) &
-            (self.transactions['effective_date']
-             >= current_stmt.iloc[0]['start_date'])
-        ]
-
-        # Apply transactions to balance due
-        for _, txn in relevant_txns.iterrows():
-            if txn['direction'] == 'CREDIT':
-                balance_due = max(0, balance_due - txn['amount'])
-            else:
-                balance_due += txn['amount']
+        stmt_idx = matches[-1]
+        balance_due = float(self.statements['balance_due'].iat[stmt_idx])
+        stmt_start_date = self.statements['start_date'].iat[stmt_idx]
+
+        # Sum PAYMENT and EXTENSION transactions between the statement start
+        # and the given date off the precomputed credits cumsum. These rows
+        # are all credits, so clamping once after the subtraction is
+        # equivalent to the per-row max(0, ...) walk it replaces.
+        lo = np.searchsorted(
+            self._effective_dates,
+            np.datetime64(stmt_start_date), side='left')
+        hi = np.searchsorted(
+            self._effective_dates, np.datetime64(date), side='right')
+        if hi == 0:
+            credits = 0.0
+        else:
+            credits = self._credits_cum[hi - 1] - \
+                (self._credits_cum[lo - 1] if lo else 0.0)
 
-        return balance_due
+        return max(0.0, balance_due - credits)
 
     def get_unified_timeline(self):
         """
@@ -615,150 +914,175 @@ class KeepCardSimulator:
         DataFrame: Timeline of all events sorted by date
         """
         if self.transactions.empty and not self.extension_factory.extensions:
-            return pd.DataFrame(columns=['Date', 'Card Event', 'Card Details', 'Extension Event', 'Extension Details'])
+            return self._EMPTY_TIMELINE
 
-        # Initialize timeline with columns for both products
-        timeline = pd.DataFrame(columns=[
-                                'Date', 'Card Event', 'Card Details', 'Extension Event', 'Extension Details'])
+        # Collect event rows as plain dicts and build the timeline DataFrame
+        # once at the end; concatenating inside the loop recopies the whole
+        # accumulated frame per event
+        rows = []
 
-        # Get all dates where something happens (transactions, statements, extension events)
-        all_dates = []
+        # Gather every contributing date column as an array and dedupe/sort
+        # them all in one np.unique call instead of set + sorted over a
+        # Python list full of duplicates
+        date_parts = []
 
         # Add transaction dates
         if not self.transactions.empty:
-            all_dates.extend(self.transactions['effective_date'].tolist())
+            date_parts.append(self.transactions['effective_date'].to_numpy())
 
         # Add statement dates
         if not self.statements.empty:
-            for _, stmt in self.statements.iterrows():
-                all_dates.append(stmt['start_date'])  # New statement
-                all_dates.append(stmt['due_date'])    # Payment due
+            date_parts.append(self.statements['start_date'].to_numpy())
+            date_parts.append(self.statements['due_date'].to_numpy())
 
         # Add extension events
         for ext in self.extension_factory.extensions:
-
-            all_dates.append(ext.start_date)  # Extension creation
-
-            all_dates += ext.payment_schedule.loc[:, 'payment_date'].to_list()
-
-            for payment in ext.payments:
-                all_dates.append(payment['payment_date'])  # Actual payments
-
-        # Remove duplicates and sort
-        all_dates = sorted(list(set(all_dates)))
+            # Extension creation
+            date_parts.append(np.array([ext.start_date], dtype=object))
+            # Scheduled payments
+            date_parts.append(ext.payment_schedule['payment_date'].to_numpy())
+            # Actual payments
+            if not ext.payments.empty:
+                date_parts.append(ext.payments['payment_date'].to_numpy())
+
+        all_dates = np.unique(np.concatenate(date_parts)).tolist()
+
+        # Group transactions and statements by date once; the per-date loop
+        # then does hash lookups instead of rescanning every row with a
+        # fresh boolean mask per date
+        tx_by_date = {}
+        if not self.transactions.empty:
+            tx_by_date = dict(tuple(
+                self.transactions.groupby('effective_date', sort=False)))
+        stmt_by_start = {}
+        stmt_by_due = {}
+        if not self.statements.empty:
+            stmt_by_start = dict(tuple(
+                self.statements.groupby('start_date', sort=False)))
+            stmt_by_due = dict(tuple(
+                self.statements.groupby('due_date', sort=False)))
+
+        # Index every extension's scheduled and actual payments into one
+        # date-keyed dict up front; the per-date loop then does a single O(1)
+        # lookup instead of probing each extension separately. Appending each
+        # extension's scheduled entries before its actuals preserves the
+        # per-date event order the old nested loops produced.
+        ext_events_by_date = defaultdict(list)
+        for ext in self.extension_factory.extensions:
+            for record in ext.payment_schedule.to_dict('records'):
+                ext_events_by_date[record['payment_date']].append(
+                    (ext, 'PAYMENT DUE', record))
+            for payment in ext.payments.to_dict('records'):
+                ext_events_by_date[payment['payment_date']].append(
+                    (ext, 'PAYMENT MADE', payment))
 
         # For each date, calculate the correct balance and balance due
         # and add all events that occurred on that date
         for date in all_dates:
-            # Calculate the rolling balance and balance due for this date
-            txs_on_date = self.transactions[self.transactions['effective_date'] == date]
-
-            if not txs_on_date.empty:
-                # For each transaction on this date, add a card event
-                for _, tx in txs_on_date.iterrows():
-                    # Recalculate balance due properly for this specific transaction
-                    # This ensures payments correctly affect the balance due
-                    balance_due = self.calculate_period_balance_due(date)
+            # Balance due only depends on the date, so compute it at most once
+            # per date instead of once per transaction and once per due
+            # statement on that date
+            balance_due_on_date = None
 
-                    event = tx['type']
-                    details = f"{tx['direction']}: ${tx['amount']:.2f}, Balance: ${tx['balance']:.2f}, Balance Due: ${balance_due:.2f}"
+            # Calculate the rolling balance and balance due for this date
+            txs_on_date = tx_by_date.get(date)
+
+            if txs_on_date is not None:
+                balance_due = self.calculate_period_balance_due(date)
+                balance_due_on_date = balance_due
+
+                # For each transaction on this date, add a card event; pull
+                # the columns out once and zip them rather than boxing a
+                # Series per row with iterrows
+                for event, direction, amount, balance in zip(
+                        txs_on_date['type'].tolist(),
+                        txs_on_date['direction'].tolist(),
+                        txs_on_date['amount'].tolist(),
+                        txs_on_date['balance'].tolist()):
+                    details = f"{direction}: ${amount:.2f}, Balance: ${balance:.2f}, Balance Due: ${balance_due:.2f}"
 
                     # For extensions, add to both columns
-                    if tx['type'] == 'EXTENSION':
-                        new_row = pd.DataFrame({
-                            'Date': [date],
-                            'Card Event': [event],
-                            'Card Details': [details],
-                            'Extension Event': ['CREATED'],
-                            'Extension Details': [f"Amount: ${tx['amount']:.2f} moved to Extension product"]
+                    if event == 'EXTENSION':
+                        rows.append({
+                            'Date': date,
+                            'Card Event': event,
+                            'Card Details': details,
+                            'Extension Event': 'CREATED',
+                            'Extension Details': f"Amount: ${amount:.2f} moved to Extension product"
                         })
                     else:
-                        new_row = pd.DataFrame({
-                            'Date': [date],
-                            'Card Event': [event],
-                            'Card Details': [details],
-                            'Extension Event': [''],
-                            'Extension Details': ['']
+                        rows.append({
+                            'Date': date,
+                            'Card Event': event,
+                            'Card Details': details,
+                            'Extension Event': '',
+                            'Extension Details': ''
                         })
 
-                    timeline = pd.concat(
-                        [timeline, new_row], ignore_index=True)
-
             # Add statement events for this date
-            if not self.statements.empty:
+            if stmt_by_start or stmt_by_due:
                 # New statement starts
-                stmt_starts = self.statements[self.statements['start_date'] == date]
-                if not stmt_starts.empty:
-                    for _, stmt in stmt_starts.iterrows():
-                        balance_due = stmt['beginning_balance']
-                        new_row = pd.DataFrame({
-                            'Date': [date],
-                            'Card Event': ['NEW STATEMENT'],
-                            'Card Details': [f"Beginning Balance: ${stmt['beginning_balance']:.2f}, Balance Due: ${balance_due:.2f}"],
-                            'Extension Event': [''],
-                            'Extension Details': ['']
+                stmt_starts = stmt_by_start.get(date)
+                if stmt_starts is not None:
+                    for stmt in stmt_starts.itertuples(index=False):
+                        balance_due = stmt.beginning_balance
+                        rows.append({
+                            'Date': date,
+                            'Card Event': 'NEW STATEMENT',
+                            'Card Details': f"Beginning Balance: ${stmt.beginning_balance:.2f}, Balance Due: ${balance_due:.2f}",
+                            'Extension Event': '',
+                            'Extension Details': ''
                         })
-                        timeline = pd.concat(
-                            [timeline, new_row], ignore_index=True)
 
                 # Payment due
-                stmt_dues = self.statements[self.statements['due_date'] == date]
-                if not stmt_dues.empty:
-                    for _, stmt in stmt_dues.iterrows():
-                        balance_due = self.calculate_period_balance_due(date)
-                        new_row = pd.DataFrame({
-                            'Date': [date],
-                            'Card Event': ['PAYMENT DUE'],
-                            'Card Details': [f"Balance Due: ${balance_due:.2f}"],
-                            'Extension Event': [''],
-                            'Extension Details': ['']
+                stmt_dues = stmt_by_due.get(date)
+                if stmt_dues is not None:
+                    if balance_due_on_date is None:
+                        balance_due_on_date = self.calculate_period_balance_due(
+                            date)
+                    for stmt in stmt_dues.itertuples(index=False):
+                        balance_due = balance_due_on_date
+                        rows.append({
+                            'Date': date,
+                            'Card Event': 'PAYMENT DUE',
+                            'Card Details': f"Balance Due: ${balance_due:.2f}",
+                            'Extension Event': '',
+                            'Extension Details': ''
                         })
-                        timeline = pd.concat(
-                            [timeline, new_row], ignore_index=True)
 
             # Add extension events for this date
-            for ext in self.extension_factory.extensions:
+            for ext, event, payment in ext_events_by_date.get(date, ()):
                 # Skip extension creation as it's already captured as EXTENSION in transactions
                 if ext.start_date == date:
                     continue
 
-                scheduled_payments_list = ext.payment_schedule.to_dict(
-                    'records')
-                # Check scheduled payments
-                scheduled_payments = [
-                    p for p in scheduled_payments_list if p['payment_date'] == date]
-                for payment in scheduled_payments:
-                    new_row = pd.DataFrame({
-                        'Date': [date],
-                        'Card Event': [''],
-                        'Card Details': [''],
-                        'Extension Event': ['PAYMENT DUE'],
-                        'Extension Details': [f"ID: {ext.extension_id}, Payment: ${(payment['remaining_principal'] + payment['remaining_interest']):.2f} (P: ${payment['remaining_principal']:.2f}, I: ${payment['remaining_interest']:.2f})"]
+                if event == 'PAYMENT DUE':
+                    rows.append({
+                        'Date': date,
+                        'Card Event': '',
+                        'Card Details': '',
+                        'Extension Event': 'PAYMENT DUE',
+                        'Extension Details': f"ID: {ext.extension_id}, Payment: ${(payment['remaining_principal'] + payment['remaining_interest']):.2f} (P: ${payment['remaining_principal']:.2f}, I: ${payment['remaining_interest']:.2f})"
                     })
-                    timeline = pd.concat(
-                        [timeline, new_row], ignore_index=True)
-
-                # Check actual payments made
-                actual_payments = [
-                    p for p in ext.payments if p['payment_date'] == date]
-                for payment in actual_payments:
-                    new_row = pd.DataFrame({
-                        'Date': [date],
-                        'Card Event': [''],
-                        'Card Details': [''],
-                        'Extension Event': ['PAYMENT MADE'],
-                        'Extension Details': [f"ID: {ext.extension_id}, Amount: ${payment['payment_amount']:.2f}, Remaining: ${payment['remaining_balance']:.2f}"]
+                else:
+                    rows.append({
+                        'Date': date,
+                        'Card Event': '',
+                        'Card Details': '',
+                        'Extension Event': 'PAYMENT MADE',
+                        'Extension Details': f"ID: {ext.extension_id}, Amount: ${payment['payment_amount']:.2f}, Remaining: ${payment['remaining_balance']:.2f}"
                     })
-                    timeline = pd.concat(
-                        [timeline, new_row], ignore_index=True)
 
-        # Sort by date (again to ensure order after all additions)
-        timeline = timeline.sort_values(
-            by=['Date', 'Card Event'],
-            ascending=[True, True],
-            key=lambda x: pd.Categorical(x, categories=[
-                'NEW STATEMENT', 'PAYMENT DUE', 'EXTENSION', 'PAYMENT', 'PURCHASE'], ordered=True) if x.name == 'Card Event' else x
-        )
+        timeline = pd.DataFrame(rows, columns=[
+            'Date', 'Card Event', 'Card Details', 'Extension Event', 'Extension Details'])
+
+        # Sort by date (again to ensure order after all additions); a mapped
+        # integer rank sorts same-day events without rebuilding a Categorical
+        # per sort call
+        timeline['_ce_rank'] = timeline['Card Event'].map(
+            _CARD_EVENT_RANK).fillna(99).astype('int8')
+        timeline = timeline.sort_values(by=['Date', '_ce_rank'])
+        timeline = timeline.drop(columns='_ce_rank')
 
         # Reset index
         timeline = timeline.reset_index(drop=True)
@@ -773,21 +1097,16 @@ class KeepCardSimulator:
             print("No events to display.")
             return
 
-        # Format the dates for display
-        timeline['Date'] = timeline['Date'].apply(
-            lambda x: x.strftime('%Y-%m-%d') if hasattr(x, 'strftime') else str(x))
-
-        # Set display options to handle wider tables
-        pd.set_option('display.max_columns', None)
-        pd.set_option('display.width', 150)
-
-        # Print the timeline
-        print("=== UNIFIED TIMELINE OF CARD AND EXTENSION EVENTS ===")
-        print(timeline.to_string(index=False))
+        # Format the dates for display in a single vectorized pass
+        timeline['Date'] = _fmt_date(timeline['Date'])
 
-        # Reset display options
-        pd.reset_option('display.max_columns')
-        pd.reset_option('display.width')
+        # Widen the display only for the duration of this render instead of
+        # mutating and resetting the global options, and emit one write
+        with pd.option_context('display.max_columns', None,
+                               'display.width', 150):
+            sys.stdout.write(
+                "=== UNIFIED TIMELINE OF CARD AND EXTENSION EVENTS ===\n"
+                + timeline.to_string(index=False) + '\n')
 
     def get_side_by_side_view(self):
         """
@@ -798,33 +1117,31 @@ class KeepCardSimulator:
 
         # Format statements
         if not self.statements.empty:
-            stmt_display = []
-            for _, stmt in self.statements.iterrows():
-                start_date_str = stmt['start_date'].strftime(
-                    '%Y-%m-%d') if hasattr(stmt['start_date'], 'strftime') else str(stmt['start_date'])
-                end_date_str = stmt['end_date'].strftime(
-                    '%Y-%m-%d') if hasattr(stmt['end_date'], 'strftime') else str(stmt['end_date'])
-                due_date_str = stmt['due_date'].strftime(
-                    '%Y-%m-%d') if hasattr(stmt['due_date'], 'strftime') else str(stmt['due_date'])
-
-                row = {
-                    'Period': f"{start_date_str} to {end_date_str}",
-                    'Due Date': due_date_str,
-                    'Balance Due': f"${stmt['balance_due']:.2f}",
-                    'Begin Balance': f"${stmt['beginning_balance']:.2f}",
-                    'Purchases': f"${stmt['purchases_amount']:.2f}",
-                    'Refunds': f"${stmt['refunds_amount']:.2f}",
-                    'Payments': f"${stmt['payments_amount']:.2f}",
-                }
-
-                if 'extensions_amount' in stmt and stmt['extensions_amount'] > 0:
-                    row['Extensions'] = f"${stmt['extensions_amount']:.2f}"
-
-                row['End Balance'] = f"${stmt['ending_balance']:.2f}"
-
-                stmt_display.append(row)
-
-            stmt_display = pd.DataFrame(stmt_display)
+            # Build every display column in one vectorized pass instead of a
+            # Python dict per statement row
+            stmts = self.statements
+            start_strs = _fmt_date(stmts['start_date'])
+            end_strs = _fmt_date(stmts['end_date'])
+
+            stmt_display = pd.DataFrame({
+                'Period': start_strs + ' to ' + end_strs,
+                'Due Date': _fmt_date(stmts['due_date']),
+                'Balance Due': _fmt_money(stmts['balance_due']),
+                'Begin Balance': _fmt_money(stmts['beginning_balance']),
+                'Purchases': _fmt_money(stmts['purchases_amount']),
+                'Refunds': _fmt_money(stmts['refunds_amount']),
+                'Payments': _fmt_money(stmts['payments_amount']),
+                'End Balance': _fmt_money(stmts['ending_balance']),
+            })
+
+            # Statements without an extension leave the cell missing, so the
+            # column only exists when at least one statement had an extension
+            extensions = stmts['extensions_amount'].astype(np.float64)
+            has_extension = (extensions > 0).to_numpy()
+            if has_extension.any():
+                stmt_display['Extensions'] = np.where(
+                    has_extension,
+                    _fmt_money(extensions).astype(object), np.nan)
         else:
             stmt_display = pd.DataFrame(columns=[
                 'Period', 'Due Date', 'Balance Due', 'Begin Balance', 'Purchases',
@@ -848,61 +1165,33 @@ class KeepCardSimulator:
             print("No statement extensions found.")
             return
 
+        # Accumulate the report and write it in one go instead of a print
+        # call per line per extension
+        out = []
+
         for ext in self.extension_factory.extensions:
-            print(f"=== EXTENSION ID: {ext.extension_id} ===")
-            print(f"Original Amount: ${ext.original_amount:.2f}")
-            print(f"Start Date: {ext.start_date.strftime('%Y-%m-%d')}")
-            print(f"Term: {ext.term_months} months")
-            print(f"APR: {ext.apr}%")
-            print(f"Monthly Payment: ${ext.monthly_payment:.2f}")
-            print(f"Current Balance: ${ext.current_balance:.2f}")
-            print(f"Status: {ext.status}")
-
-            print("\nPayment Schedule:")
-            schedule_df = pd.DataFrame(ext.payment_schedule)
-            schedule_df['payment_date'] = schedule_df['payment_date'].apply(
-                lambda x: x.strftime('%Y-%m-%d') if hasattr(x, 'strftime') else str(x))
-            schedule_df['payment_amount'] = schedule_df['payment_amount'].apply(
-                lambda x: f"${x:.2f}")
-            schedule_df['principal_amount'] = schedule_df['principal_amount'].apply(
-                lambda x: f"${x:.2f}")
-            schedule_df['interest_amount'] = schedule_df['interest_amount'].apply(
-                lambda x: f"${x:.2f}")
-            schedule_df['remaining_principal'] = schedule_df['remaining_principal'].apply(
-                lambda x: f"${x:.2f}")
-            schedule_df['remaining_interest'] = schedule_df['remaining_interest'].apply(
-                lambda x: f"${x:.2f}")
-
-            print(schedule_df.rename(columns={
-                'payment_number': 'Payment #',
-                'payment_date': 'Due Date',
-                'payment_amount': 'Amount',
-                'principal_amount': 'Principal',
-                'interest_amount': 'Interest',
-                'remaining_principal': 'Remaining Principal',
-                'remaining_interest': 'Remaining Interest'
-            }).to_string(index=False))
-
-            if ext.payments:
-                print("\nActual Payments Made:")
-                payments_df = pd.DataFrame(ext.payments)
-                payments_df['payment_date'] = payments_df['payment_date'].apply(
-                    lambda x: x.strftime('%Y-%m-%d') if hasattr(x, 'strftime') else str(x))
-                payments_df['payment_amount'] = payments_df['payment_amount'].apply(
-                    lambda x: f"${x:.2f}")
-                payments_df['principal_paid'] = payments_df['principal_paid'].apply(
-                    lambda x: f"${x:.2f}")
-                payments_df['interest_paid'] = payments_df['interest_paid'].apply(
-                    lambda x: f"${x:.2f}")
-                payments_df['remaining_balance'] = payments_df['remaining_balance'].apply(
-                    lambda x: f"${x:.2f}")
-
-                print(payments_df.rename(columns={
-                    'payment_date': 'Date',
-                    'payment_amount': 'Amount',
-                    'principal_paid': 'Principal',
-                    'interest_paid': 'Interest',
-                    'remaining_balance': 'Remaining'
-                }).to_string(index=False))
-
-            print("\n" + "="*50 + "\n")
+            out.append(f"=== EXTENSION ID: {ext.extension_id} ===")
+            out.append(f"Original Amount: ${ext.original_amount:.2f}")
+            out.append(f"Start Date: {ext.start_date.strftime('%Y-%m-%d')}")
+            out.append(f"Term: {ext.term_months} months")
+            out.append(f"APR: {ext.apr}%")
+            out.append(f"Monthly Payment: ${ext.monthly_payment:.2f}")
+            out.append(f"Current Balance: ${ext.current_balance:.2f}")
+            out.append(f"Status: {ext.status}")
+
+            out.append("\nPayment Schedule:")
+            # Formatting is deferred to to_string formatters, which only fire
+            # for the rendered output — no formatted copies of the frames
+            out.append(ext.payment_schedule
+                       .rename(columns=_SCHEDULE_DISPLAY_COLS)
+                       .to_string(index=False, formatters=_SCHEDULE_FORMATTERS))
+
+            if not ext.payments.empty:
+                out.append("\nActual Payments Made:")
+                out.append(ext.payments
+                           .rename(columns=_PAYMENT_DISPLAY_COLS)
+                           .to_string(index=False, formatters=_PAYMENT_FORMATTERS))
+
+            out.append("\n" + "="*50 + "\n")
+
+        sys.stdout.write('\n'.join(out) + '\n')
@@ -1,7 +1,62 @@
 from decimal import Decimal
+from collections import OrderedDict
 import pandas as pd
+import numpy as np
 import datetime
 
+_CENT = Decimal('0.01')
+
+# Bound on the per-instance query memo; old entries are evicted FIFO
+_QUERY_CACHE_SIZE = 16
+
+
+def _memo_get(cache, key):
+    """Look up a memoized query result, or None if absent."""
+    return cache.get(key)
+
+
+def _memo_put(cache, key, value):
+    """Store a memoized query result, evicting the oldest past the cap."""
+    cache[key] = value
+    if len(cache) > _QUERY_CACHE_SIZE:
+        cache.popitem(last=False)
+    return value
+
+
+def _to_cents(value):
+    """Convert a Decimal amount to integer cents, rounding to the cent."""
+    return int(value.quantize(_CENT) * 100)
+
+
+def _cents_to_decimals(cents):
+    """Convert an int64 cents array to an object array of 2dp Decimals."""
+    return np.array([Decimal(int(c)).scaleb(-2) for c in cents], dtype=object)
+
+
+_DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+
+def _schedule_dates(start_date, term_months):
+    """
+    Build the monthly due dates for a schedule: start_date plus 1..term_months
+    months, with the day clamped to the length of each target month.
+
+    Computed with whole-array month arithmetic rather than a per-month Python
+    loop with its own leap-year check.
+    """
+    months0 = start_date.year * 12 + \
+        (start_date.month - 1) + np.arange(1, term_months + 1)
+    years = months0 // 12
+    months = months0 % 12 + 1
+
+    days_in_month = _DAYS_IN_MONTH[months - 1]
+    leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+    days_in_month = days_in_month + ((months == 2) & leap)
+    days = np.minimum(start_date.day, days_in_month)
+
+    return [datetime.date(year, month, day) for year, month, day
+            in zip(years.tolist(), months.tolist(), days.tolist())]
+
 
 class ExtensionProduct:
 
@@ -46,83 +101,154 @@ class ExtensionProduct:
         interest_remainder = self.total_interest - \
             (monthly_interest * Decimal(self.term_months - 1))
 
-        schedule_data = []
-        for month in range(1, self.term_months + 1):
-            payment_date = self._add_months(start_date, month)
+        # Build the schedule column-wise instead of appending a dict per month;
+        # remainder amounts go on the last payment. The schedule is stored as
+        # parallel int64 arrays holding whole cents, so the payment waterfall
+        # runs on native machine integers instead of Decimal objects; the
+        # payment_schedule property converts back to 2dp Decimals on demand.
+        payment_dates = _schedule_dates(start_date, self.term_months)
+
+        principal = np.full(self.term_months, _to_cents(
+            monthly_principal), dtype=np.int64)
+        interest = np.full(self.term_months, _to_cents(
+            monthly_interest), dtype=np.int64)
+        principal[-1] = _to_cents(principal_remainder)
+        interest[-1] = _to_cents(interest_remainder)
+        payment_cents = principal + interest
+
+        self._payment_numbers = np.arange(1, self.term_months + 1)
+        self._payment_dates = np.array(payment_dates, dtype=object)
+        self._payment_cents = payment_cents
+        self._principal_cents = principal
+        self._interest_cents = interest
+        self._remaining_principal_cents = principal.copy()
+        self._remaining_interest_cents = interest.copy()
+        self._remaining_cents = payment_cents.copy()
+        self._paid = np.zeros(self.term_months, dtype=bool)
+
+        # Running count of unpaid installments; decremented as they close so
+        # the fully-paid check is a comparison, not a column scan
+        self._unpaid_count = self.term_months
+
+        # Version counter bumped on every mutation; the cached DataFrame view
+        # is rebuilt only when it is stale. Read queries memoize on
+        # (version, payment_date), so repeated asks for the same date cost a
+        # dict lookup until the next payment invalidates them.
+        self._schedule_version = 0
+        self._schedule_cache = None
+        self._query_cache = OrderedDict()
+        self._prefix_cache = None
+
+        # Track actual payments as parallel columns (same layout as the
+        # schedule); the DataFrame view is materialized on demand
+        self._pay_dates = []
+        self._pay_amounts = []
+        self._pay_principal = []
+        self._pay_interest = []
+        self._pay_remaining = []
+        self._payments_version = 0
+        self._payments_cache = None
+        self.current_balance = self.original_amount
 
-            # Use remainder amounts for last payment
-            if month == self.term_months:
-                principal = principal_remainder
-                interest = interest_remainder
-            else:
-                principal = monthly_principal
-                interest = monthly_interest
-
-            schedule_data.append({
-                'payment_number': month,
-                'payment_date': payment_date,
-                'payment_amount': principal + interest,
-                'principal_amount': principal,
-                'interest_amount': interest,
-                'remaining_principal': principal,
-                'remaining_interest': interest,
-                'remaining_amount': principal + interest,
-                'paid': False
+    @property
+    def payment_schedule(self):
+        """DataFrame view of the schedule, rebuilt only when the arrays change."""
+        if self._schedule_cache is None or self._schedule_cache[0] != self._schedule_version:
+            frame = pd.DataFrame({
+                'payment_number': self._payment_numbers,
+                'payment_date': self._payment_dates,
+                'payment_amount': _cents_to_decimals(self._payment_cents),
+                'principal_amount': _cents_to_decimals(self._principal_cents),
+                'interest_amount': _cents_to_decimals(self._interest_cents),
+                'remaining_principal': _cents_to_decimals(self._remaining_principal_cents),
+                'remaining_interest': _cents_to_decimals(self._remaining_interest_cents),
+                'remaining_amount': _cents_to_decimals(self._remaining_cents),
+                'paid': self._paid.copy()
             })
+            self._schedule_cache = (self._schedule_version, frame)
+        return self._schedule_cache[1]
+
+    @property
+    def payments(self):
+        """DataFrame view of the actual payments, rebuilt only on change."""
+        if self._payments_cache is None or self._payments_cache[0] != self._payments_version:
+            frame = pd.DataFrame({
+                'payment_date': list(self._pay_dates),
+                'payment_amount': list(self._pay_amounts),
+                'principal_paid': list(self._pay_principal),
+                'interest_paid': list(self._pay_interest),
+                'remaining_balance': list(self._pay_remaining)
+            })
+            self._payments_cache = (self._payments_version, frame)
+        return self._payments_cache[1]
 
-        self.payment_schedule = pd.DataFrame(schedule_data)
-
-        # Track actual payments
-        self.payments = []
-        self.current_balance = self.original_amount
-
-    def _add_months(self, date, months):
-        """Add specified number of months to a date."""
-        month = date.month - 1 + months
-        year = date.year + month // 12
-        month = month % 12 + 1
-        day = min(date.day, [31, 29 if year % 4 == 0 and (year % 100 != 0 or year %
-                  400 == 0) else 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31][month-1])
-        return datetime.date(year, month, day)
+    def _remaining_prefix(self):
+        """
+        Prefix sums of remaining cents over the schedule, cached by schedule
+        version. Paid installments hold zero remaining cents, so the sum of
+        any unpaid prefix is just the prefix sum — no paid mask required.
+        """
+        if self._prefix_cache is None or self._prefix_cache[0] != self._schedule_version:
+            prefix = np.concatenate(([0], self._remaining_cents.cumsum()))
+            self._prefix_cache = (self._schedule_version, prefix)
+        return self._prefix_cache[1]
 
     def get_past_due_installments(self, payment_date):
         """
         Get all past due installments for this extension.
         """
-        installments = self.payment_schedule[
-            (self.payment_schedule['payment_date'] < payment_date) &
-            (~self.payment_schedule['paid'])
-        ]
-        return installments.sort_values(by='payment_date', ascending=True)
+        # The schedule is date-sorted, so installments strictly before the
+        # payment date are the prefix up to one searchsorted split; only the
+        # paid flags need masking. The slice inherits that order, so no
+        # re-sort is needed.
+        split = np.searchsorted(self._payment_dates, payment_date, side='left')
+        return self.payment_schedule.iloc[:split][~self._paid[:split]]
 
     def get_past_due_amount(self, payment_date):
         """
         Get the amount past due for this extension.
         """
-        installments = self.get_past_due_installments(payment_date)
-        return Decimal(str(installments['remaining_amount'].sum()))
+        key = ('past_due', self._schedule_version, payment_date)
+        cached = _memo_get(self._query_cache, key)
+        if cached is not None:
+            return cached
+
+        # With the cached prefix sums the query is a binary search plus one
+        # array read rather than a masked sum
+        split = np.searchsorted(self._payment_dates, payment_date, side='left')
+        due_cents = self._remaining_prefix()[split]
+        return _memo_put(self._query_cache, key,
+                         Decimal(int(due_cents)).scaleb(-2))
 
     def get_next_installment(self, payment_date):
         """
         Get the next installment for this extension.
         """
-        installments = self.payment_schedule[
-            (self.payment_schedule['payment_date'] >= payment_date)
-        ]
-        if installments.empty:
+        # The schedule is date-sorted, so the next installment is a single
+        # searchsorted lookup rather than a mask, sort and slice
+        idx = np.searchsorted(self._payment_dates, payment_date, side='left')
+        if idx >= self._payment_dates.size:
             return None
 
-        return installments.sort_values(by='payment_date', ascending=True).iloc[0]
+        return self.payment_schedule.iloc[idx]
 
     def get_next_due_amount(self, payment_date):
         """
         Get the amount due for the next installment.
         """
-        installment = self.get_next_installment(payment_date)
-        if installment is None or installment['paid']:
-            return Decimal('0.00')
-
-        return Decimal(str(installment['remaining_amount']))
+        key = ('next_due', self._schedule_version, payment_date)
+        cached = _memo_get(self._query_cache, key)
+        if cached is not None:
+            return cached
+
+        # Read the schedule arrays directly rather than materializing the
+        # DataFrame view for a single row
+        idx = np.searchsorted(self._payment_dates, payment_date, side='left')
+        if idx >= self._payment_dates.size or self._paid[idx]:
+            amount = Decimal('0.00')
+        else:
+            amount = Decimal(int(self._remaining_cents[idx])).scaleb(-2)
+        return _memo_put(self._query_cache, key, amount)
 
     def pay_past_due_amount(self, payment_date, payment_amount):
         """
@@ -145,119 +271,143 @@ class ExtensionProduct:
         Returns:
         dict: Payment details
         """
-        remaining_payment = Decimal(amount)
-        total_principal_paid = Decimal('0.00')
-        total_interest_paid = Decimal('0.00')
+        # The waterfall runs on integer cents: whole-cent payments need no
+        # quantize calls, and the hot loops become native int arithmetic.
+        # Decimal reappears only for the sub-cent shares in the future
+        # distribution and for the totals handed back to callers.
+        remaining_cents = _to_cents(Decimal(amount))
+        total_principal_cents = 0
+        total_interest_cents = 0
+
+        dates = self._payment_dates
+        remaining_principal = self._remaining_principal_cents
+        remaining_interest = self._remaining_interest_cents
+        remaining_amount = self._remaining_cents
+        paid = self._paid
+
+        def _pay_installment(idx, remaining_cents):
+            """Apply payment to one installment: principal first, then interest."""
+            nonlocal total_principal_cents, total_interest_cents
 
-        # First, pay past due installments (oldest to newest)
-        past_due = self.payment_schedule[
-            (self.payment_schedule['payment_date'] < payment_date) &
-            (~self.payment_schedule['paid'])
-        ]
-
-        for idx, installment in past_due.iterrows():
-            # Pay principal first
-            principal_payment = min(
-                remaining_payment, Decimal(str(installment['remaining_principal'])))
-            self.payment_schedule.at[idx,
-                                     'remaining_principal'] = (Decimal(str(installment['remaining_principal'])) - principal_payment).quantize(Decimal('0.01'))
-            remaining_payment -= principal_payment
-            total_principal_paid += principal_payment
-
-            # Then pay interest if there's money left
-            if remaining_payment > Decimal('0.00'):
-                interest_payment = min(
-                    remaining_payment, Decimal(str(installment['remaining_interest'])))
-                self.payment_schedule.at[idx,
-                                         'remaining_interest'] = (Decimal(str(installment['remaining_interest'])) - interest_payment).quantize(Decimal('0.01'))
-                remaining_payment -= interest_payment
-                total_interest_paid += interest_payment
-
-            if self.payment_schedule.at[idx, 'remaining_principal'] <= Decimal('0.00') and self.payment_schedule.at[idx, 'remaining_interest'] <= Decimal('0.00'):
-                self.payment_schedule.at[idx, 'paid'] = True
-
-            self.payment_schedule.at[idx,
-                                     'remaining_amount'] = (self.payment_schedule.at[idx, 'remaining_interest'] + self.payment_schedule.at[idx, 'remaining_principal']).quantize(Decimal('0.01'))
-
-            if remaining_payment <= Decimal('0.00'):
-                break
-
-        current_installment = self.get_next_installment(payment_date)
-
-        if current_installment is not None and current_installment['paid'] == False and remaining_payment > Decimal('0.00'):
-            idx = current_installment.name
             principal_payment = min(
-                remaining_payment, Decimal(str(current_installment['remaining_principal'])))
-            self.payment_schedule.at[idx,
-                                     'remaining_principal'] = (Decimal(str(current_installment['remaining_principal'])) - principal_payment).quantize(Decimal('0.01'))
-            remaining_payment -= principal_payment
-            total_principal_paid += principal_payment
+                remaining_cents, int(remaining_principal[idx]))
+            remaining_principal[idx] -= principal_payment
+            remaining_cents -= principal_payment
+            total_principal_cents += principal_payment
 
-            if remaining_payment > Decimal('0.00'):
+            if remaining_cents > 0:
                 interest_payment = min(
-                    remaining_payment, Decimal(str(current_installment['remaining_interest'])))
-                self.payment_schedule.at[idx,
-                                         'remaining_interest'] = (Decimal(str(current_installment['remaining_interest'])) - interest_payment).quantize(Decimal('0.01'))
-                remaining_payment -= interest_payment
-                total_interest_paid += interest_payment
-
-            if self.payment_schedule.at[idx, 'remaining_principal'] <= Decimal('0.00') and self.payment_schedule.at[idx, 'remaining_interest'] <= Decimal('0.00'):
-                self.payment_schedule.at[idx, 'paid'] = True
-
-            self.payment_schedule.at[idx, 'remaining_amount'] = (
-                self.payment_schedule.at[idx, 'remaining_interest'] + self.payment_schedule.at[idx, 'remaining_principal']).quantize(Decimal('0.01'))
+                    remaining_cents, int(remaining_interest[idx]))
+                remaining_interest[idx] -= interest_payment
+                remaining_cents -= interest_payment
+                total_interest_cents += interest_payment
+
+            if remaining_principal[idx] <= 0 and remaining_interest[idx] <= 0:
+                paid[idx] = True
+                self._unpaid_count -= 1
+
+            remaining_amount[idx] = remaining_interest[idx] + \
+                remaining_principal[idx]
+
+            return remaining_cents
+
+        # The schedule dates are monotonic by construction, so the three date
+        # filters collapse to two searchsorted splits and cheap slices of the
+        # paid flags — no boolean masks over the date column
+        split_left = np.searchsorted(dates, payment_date, side='left')
+        split_right = np.searchsorted(dates, payment_date, side='right')
+
+        # First, pay past due installments (oldest to newest). A prefix sum
+        # over their remaining cents tells how many the payment retires in
+        # full — those are closed in one vector operation — and only the
+        # boundary installment goes through the scalar waterfall.
+        past_idx = np.flatnonzero(~paid[:split_left])
+        if past_idx.size:
+            needed = remaining_amount[past_idx].cumsum()
+            covered = int(np.searchsorted(
+                needed, remaining_cents, side='right'))
+            if covered:
+                full = past_idx[:covered]
+                total_principal_cents += int(remaining_principal[full].sum())
+                total_interest_cents += int(remaining_interest[full].sum())
+                remaining_principal[full] = 0
+                remaining_interest[full] = 0
+                remaining_amount[full] = 0
+                paid[full] = True
+                self._unpaid_count -= covered
+                remaining_cents -= int(needed[covered - 1])
+            if covered < past_idx.size:
+                remaining_cents = _pay_installment(
+                    past_idx[covered], remaining_cents)
+
+        # Then pay the current (next upcoming) installment
+        if split_left < dates.size and not paid[split_left] and remaining_cents > 0:
+            remaining_cents = _pay_installment(split_left, remaining_cents)
+
+        total_principal_paid = Decimal(total_principal_cents).scaleb(-2)
+        total_interest_paid = Decimal(total_interest_cents).scaleb(-2)
 
         # Finally, distribute remaining amount across future installments
-        if remaining_payment > Decimal('0.00'):
-            future_installments = self.payment_schedule[
-                (self.payment_schedule['payment_date'] > payment_date) &
-                (~self.payment_schedule['paid'])
-            ]
+        if remaining_cents > 0:
+            future_idx = split_right + np.flatnonzero(~paid[split_right:])
+
+            if future_idx.size:
+                remaining_payment = Decimal(remaining_cents).scaleb(-2)
 
-            if not future_installments.empty:
                 # Calculate how many full installments can be covered
                 total_future_principal = Decimal(
-                    str(future_installments['remaining_principal'].sum()))
+                    int(remaining_principal[future_idx].sum())).scaleb(-2)
                 avg_installment_principal = total_future_principal / \
-                    Decimal(len(future_installments))
+                    Decimal(future_idx.size)
                 installments_covered = int(
                     remaining_payment / avg_installment_principal)
 
                 # Calculate fee to be waived based on covered installments
                 total_future_interest = Decimal(
-                    str(future_installments['remaining_interest'].sum()))
+                    int(remaining_interest[future_idx].sum())).scaleb(-2)
                 avg_installment_interest = total_future_interest / \
-                    Decimal(len(future_installments))
+                    Decimal(future_idx.size)
                 waived_interest = avg_installment_interest * \
                     Decimal(installments_covered)
 
-                # Distribute remaining payment across all future installments principal
+                # Distribute remaining payment across all future installments
+                # principal; the per-installment shares carry sub-cent
+                # precision, so this branch stays in Decimal and rounds back
+                # to whole cents per cell
                 per_installment_principal = remaining_payment / \
-                    Decimal(len(future_installments))
+                    Decimal(future_idx.size)
                 per_installment_interest = waived_interest / \
-                    Decimal(len(future_installments))
+                    Decimal(future_idx.size)
 
-                for idx, installment in future_installments.iterrows():
+                for idx in future_idx:
                     # Apply principal payment
+                    principal_cell = Decimal(
+                        int(remaining_principal[idx])).scaleb(-2)
                     principal_paid = min(
-                        per_installment_principal, Decimal(str(installment['remaining_principal'])))
-                    self.payment_schedule.at[idx,
-                                             'remaining_principal'] = (Decimal(str(installment['remaining_principal'])) - principal_paid).quantize(Decimal('0.01'))
+                        per_installment_principal, principal_cell)
+                    remaining_principal[idx] = _to_cents(
+                        principal_cell - principal_paid)
                     total_principal_paid += principal_paid
 
                     # Apply waived interest
+                    interest_cell = Decimal(
+                        int(remaining_interest[idx])).scaleb(-2)
                     interest_waived = min(
-                        per_installment_interest, Decimal(str(installment['remaining_interest'])))
-                    self.payment_schedule.at[idx,
-                                             'remaining_interest'] = (Decimal(str(installment['remaining_interest'])) - interest_waived).quantize(Decimal('0.01'))
+                        per_installment_interest, interest_cell)
+                    remaining_interest[idx] = _to_cents(
+                        interest_cell - interest_waived)
                     total_interest_paid += interest_waived
 
                     # Mark installment as paid if no principal or interest remains
-                    if self.payment_schedule.at[idx, 'remaining_principal'] <= Decimal('0.00') and self.payment_schedule.at[idx, 'remaining_interest'] <= Decimal('0.00'):
-                        self.payment_schedule.at[idx, 'paid'] = True
+                    if remaining_principal[idx] <= 0 and remaining_interest[idx] <= 0:
+                        paid[idx] = True
+                        self._unpaid_count -= 1
 
-                    self.payment_schedule.at[idx, 'remaining_amount'] = (
-                        self.payment_schedule.at[idx, 'remaining_interest'] + self.payment_schedule.at[idx, 'remaining_principal']).quantize(Decimal('0.01'))
+                    remaining_amount[idx] = remaining_interest[idx] + \
+                        remaining_principal[idx]
+
+        # Invalidate the cached DataFrame view
+        self._schedule_version += 1
 
         # Update current balance and record payment
         self.current_balance = max(
@@ -270,10 +420,15 @@ class ExtensionProduct:
             'interest_paid': total_interest_paid,
             'remaining_balance': self.current_balance
         }
-        self.payments.append(payment)
+        self._pay_dates.append(payment_date)
+        self._pay_amounts.append(amount)
+        self._pay_principal.append(total_principal_paid)
+        self._pay_interest.append(total_interest_paid)
+        self._pay_remaining.append(self.current_balance)
+        self._payments_version += 1
 
         # Check if extension is fully paid
-        if self.payment_schedule['paid'].all():
+        if self._unpaid_count == 0:
             self.status = "PAID"
 
         return payment
@@ -282,13 +437,50 @@ class ExtensionProduct:
 class ExtensionFactory:
     def __init__(self):
         self.extensions = []
+        self._extensions_by_id = {}
+        # Aggregate queries memoize on the tuple of extension schedule
+        # versions, so any payment anywhere invalidates the entry
+        self._aggregate_cache = OrderedDict()
+        # Flat concatenation of every active schedule, rebuilt lazily when
+        # any extension's version changes
+        self._flat_cache = None
 
     def create_extension(self, extension_id, amount, start_date, term_months, apr=Decimal('36.0')):
         extension = ExtensionProduct(
             extension_id, Decimal(amount), start_date, term_months, Decimal(apr))
         self.extensions.append(extension)
+        self._extensions_by_id[extension_id] = extension
         return extension
 
+    def get_extension(self, extension_id):
+        """Look up an extension by id, or None if it does not exist."""
+        return self._extensions_by_id.get(extension_id)
+
+    def _flat_schedules(self):
+        """
+        Concatenated due dates and remaining cents across all active
+        extensions, cached until any extension's schedule version changes.
+        Paid installments carry zero remaining cents, so aggregate sums need
+        no paid mask.
+        """
+        versions = tuple(ext._schedule_version for ext in self.extensions)
+        if self._flat_cache is None or self._flat_cache[0] != versions:
+            date_parts = []
+            remaining_parts = []
+            for ext in self.extensions:
+                if ext.status == "ACTIVE":
+                    date_parts.append(
+                        np.array(ext._payment_dates, dtype='datetime64[D]'))
+                    remaining_parts.append(ext._remaining_cents)
+            if date_parts:
+                flat_dates = np.concatenate(date_parts)
+                flat_remaining = np.concatenate(remaining_parts)
+            else:
+                flat_dates = np.array([], dtype='datetime64[D]')
+                flat_remaining = np.array([], dtype=np.int64)
+            self._flat_cache = (versions, flat_dates, flat_remaining)
+        return self._flat_cache[1], self._flat_cache[2]
+
     def get_past_due_amount(self, payment_date):
         """
         Get the total past due amount across all active extensions.
@@ -303,11 +495,19 @@ class ExtensionFactory:
             payment_date = datetime.datetime.strptime(
                 payment_date, '%Y-%m-%d').date()
 
-        total_past_due = Decimal('0.00')
-        for extension in self.extensions:
-            if extension.status == "ACTIVE":
-                total_past_due += extension.get_past_due_amount(payment_date)
-        return total_past_due
+        key = ('past_due', tuple(
+            ext._schedule_version for ext in self.extensions), payment_date)
+        cached = _memo_get(self._aggregate_cache, key)
+        if cached is not None:
+            return cached
+
+        # One masked reduction over the flat concatenated schedules replaces
+        # a per-extension Python loop of schedule scans
+        flat_dates, flat_remaining = self._flat_schedules()
+        due_cents = flat_remaining[flat_dates <
+                                   np.datetime64(payment_date)].sum()
+        total_past_due = Decimal(int(due_cents)).scaleb(-2)
+        return _memo_put(self._aggregate_cache, key, total_past_due)
 
     def get_next_due_amount(self, payment_date):
         """
@@ -323,11 +523,17 @@ class ExtensionFactory:
             payment_date = datetime.datetime.strptime(
                 payment_date, '%Y-%m-%d').date()
 
+        key = ('next_due', tuple(
+            ext._schedule_version for ext in self.extensions), payment_date)
+        cached = _memo_get(self._aggregate_cache, key)
+        if cached is not None:
+            return cached
+
         total_due = Decimal('0.00')
         for extension in self.extensions:
             if extension.status == "ACTIVE":
                 total_due += extension.get_next_due_amount(payment_date)
-        return total_due
+        return _memo_put(self._aggregate_cache, key, total_due)
 
     def make_payment(self, payment_date, amount):
         """
@@ -347,44 +553,41 @@ class ExtensionFactory:
         remaining_payment = Decimal(amount)
         payments_made = []
 
-        # Get all past due installments across active extensions
-        all_installments = []
+        # Collect past due installments (plus the next upcoming one) across
+        # active extensions straight from the schedule arrays, then order
+        # them with one C-level stable argsort on a datetime64 array instead
+        # of materializing row dicts and sorting with a Python key function
+        installments = []
+        installment_dates = []
         for extension in self.extensions:
             if extension.status == "ACTIVE":
-                # Get past due installments
-                past_due = extension.get_past_due_installments(payment_date)
-                for idx, installment in past_due.iterrows():
-                    all_installments.append({
-                        'extension': extension,
-                        'payment_date': installment['payment_date'],
-                        'idx': idx,
-                        'remaining_principal': Decimal(str(installment['remaining_principal'])),
-                        'remaining_interest': Decimal(str(installment['remaining_interest'])),
-                        'remaining_amount': Decimal(str(installment['remaining_amount']))
-                    })
-
-                next_due = extension.get_next_installment(payment_date)
-                if next_due is not None:
-                    all_installments.append({
-                        'extension': extension,
-                        'payment_date': next_due['payment_date'],
-                        'remaining_amount': Decimal(str(next_due['remaining_amount']))
-                    })
-
-        # Sort by payment date
-        all_installments.sort(key=lambda x: x['payment_date'])
+                dates = extension._payment_dates
+                remaining = extension._remaining_cents
+                split = int(np.searchsorted(dates, payment_date, side='left'))
+
+                for i in np.flatnonzero(~extension._paid[:split]):
+                    installments.append(
+                        (extension, Decimal(int(remaining[i])).scaleb(-2)))
+                    installment_dates.append(dates[i])
+
+                if split < dates.size:
+                    installments.append(
+                        (extension, Decimal(int(remaining[split])).scaleb(-2)))
+                    installment_dates.append(dates[split])
+
+        order = np.argsort(
+            np.array(installment_dates, dtype='datetime64[D]'), kind='stable')
 
         # Pay installments in order
-        for installment in all_installments:
+        for pos in order:
             if remaining_payment <= Decimal('0.00'):
                 break
 
-            extension = installment['extension']
-            payment_amount = min(
-                installment['remaining_amount'], remaining_payment)
+            extension, remaining_amount = installments[pos]
+            payment_amount = min(remaining_amount, remaining_payment)
             payment = extension.make_payment(
                 payment_amount, payment_date)
-            remaining_payment -= Decimal(str(payment['payment_amount']))
+            remaining_payment -= payment['payment_amount']
             payments_made.append(payment)
 
         # Pay remaining amount to extensions from oldest to newest
@@ -397,8 +600,7 @@ class ExtensionFactory:
                         extension.current_balance, remaining_payment)
                     payment = extension.make_payment(
                         payment_amount, payment_date)
-                    remaining_payment -= Decimal(
-                        str(payment['payment_amount']))
+                    remaining_payment -= payment['payment_amount']
                     payments_made.append(payment)
 
         return {
@@ -0,0 +1,196 @@
+import pytest
+import datetime
+from decimal import Decimal
+from engine import KeepCardSimulator
+
+
+@pytest.fixture
+def simulator():
+    """Create a simulator with statement cycles starting on the 3rd"""
+    return KeepCardSimulator(statement_cycle_start=3)
+
+
+@pytest.fixture
+def simulator_with_activity(simulator):
+    """Simulator loaded with two months of purchases, a payment and a refund"""
+    simulator.add_transaction('PURCHASE', 200.00, '2025-01-05', '2025-01-05')
+    simulator.add_transaction('PURCHASE', 300.00, '2025-01-10', '2025-01-10')
+    simulator.add_transaction('PAYMENT', 150.00, '2025-02-10', '2025-02-10')
+    simulator.add_transaction('PURCHASE', 100.00, '2025-02-10', '2025-02-10')
+    simulator.add_transaction('REFUND', 50.00, '2025-02-15', '2025-02-15')
+    return simulator
+
+
+def test_running_balance(simulator_with_activity):
+    """Test that the running balance reflects debits and credits in order"""
+    transactions = simulator_with_activity.transactions
+
+    assert len(transactions) == 5
+    assert transactions['balance'].tolist() == [
+        200.0, 500.0, 350.0, 450.0, 400.0]
+
+
+def test_same_day_transactions_sorted_by_type(simulator_with_activity):
+    """Test that payments sort before purchases on the same effective date"""
+    transactions = simulator_with_activity.transactions
+
+    same_day = transactions[transactions['effective_date']
+                            == datetime.date(2025, 2, 10)]
+    assert same_day['type'].tolist() == ['PAYMENT', 'PURCHASE']
+
+
+def test_transaction_directions(simulator_with_activity):
+    """Test that direction is derived from the transaction type"""
+    transactions = simulator_with_activity.transactions
+
+    directions = dict(zip(transactions['type'], transactions['direction']))
+    assert directions['PURCHASE'] == 'DEBIT'
+    assert directions['PAYMENT'] == 'CREDIT'
+    assert directions['REFUND'] == 'CREDIT'
+
+
+def test_statement_totals(simulator_with_activity):
+    """Test statement period boundaries and per-period totals"""
+    statements = simulator_with_activity.statements
+
+    # January cycle: two purchases totalling $500
+    january = statements.iloc[1]
+    assert january['start_date'] == datetime.date(2025, 1, 3)
+    assert january['end_date'] == datetime.date(2025, 2, 2)
+    assert january['purchases_amount'] == 500.0
+    assert january['ending_balance'] == 500.0
+
+    # February cycle: purchase, refund and payment
+    february = statements.iloc[2]
+    assert february['beginning_balance'] == 500.0
+    assert february['purchases_amount'] == 100.0
+    assert february['refunds_amount'] == 50.0
+    assert february['payments_amount'] == 150.0
+    assert february['ending_balance'] == 400.0
+    assert february['balance_due'] == 500.0
+
+
+def test_calculate_period_balance_due(simulator_with_activity):
+    """Test that payments reduce the balance due within a period"""
+    balance_due = simulator_with_activity.calculate_period_balance_due(
+        datetime.date(2025, 2, 20))
+
+    assert balance_due == 250.0
+
+
+def test_generate_bulk_transactions_deterministic(simulator):
+    """Test bulk generation without randomization"""
+    simulator.generate_bulk_transactions(
+        num_purchases=10, avg_purchase_amount=50,
+        num_payments=2, avg_payment_amount=100,
+        start_date='2025-01-05', end_date='2025-01-25', randomize=False)
+
+    transactions = simulator.transactions
+    assert len(transactions) == 12
+    assert (transactions[transactions['type'] == 'PURCHASE']
+            ['amount'] == 50.0).all()
+    assert transactions['balance'].iloc[-1] == 10 * 50.0 - 2 * 100.0
+
+
+def test_incremental_statement_update_matches_full_rebuild(simulator_with_activity):
+    """Test that inserts into existing cycles match a from-scratch rebuild"""
+    # Materialize statements, then insert into an already-generated cycle
+    simulator_with_activity.statements
+    simulator_with_activity.add_transaction(
+        'PURCHASE', 75.00, '2025-01-20', '2025-01-20')
+
+    fresh = KeepCardSimulator(statement_cycle_start=3)
+    fresh.add_transaction('PURCHASE', 200.00, '2025-01-05', '2025-01-05')
+    fresh.add_transaction('PURCHASE', 300.00, '2025-01-10', '2025-01-10')
+    fresh.add_transaction('PAYMENT', 150.00, '2025-02-10', '2025-02-10')
+    fresh.add_transaction('PURCHASE', 100.00, '2025-02-10', '2025-02-10')
+    fresh.add_transaction('REFUND', 50.00, '2025-02-15', '2025-02-15')
+    fresh.add_transaction('PURCHASE', 75.00, '2025-01-20', '2025-01-20')
+
+    columns = ['start_date', 'end_date', 'due_date', 'beginning_balance',
+               'ending_balance', 'purchases_amount', 'refunds_amount',
+               'payments_amount', 'extensions_amount', 'balance_due']
+    incremental = simulator_with_activity.statements[columns]
+    rebuilt = fresh.statements[columns]
+    assert incremental.equals(rebuilt)
+
+    # The embedded per-statement transaction frames (including the rewritten
+    # balance column) must match a rebuild as well, not just the scalars
+    for mine, theirs in zip(simulator_with_activity.statements['transactions'],
+                            fresh.statements['transactions']):
+        assert mine.equals(theirs)
+
+    # Insert earlier than every existing transaction: the statement anchor
+    # month moves, which the cached cycles cannot absorb incrementally
+    simulator_with_activity.add_transaction(
+        'PURCHASE', 40.00, '2024-12-20', '2024-12-20')
+
+    fresh = KeepCardSimulator(statement_cycle_start=3)
+    fresh.add_transaction('PURCHASE', 200.00, '2025-01-05', '2025-01-05')
+    fresh.add_transaction('PURCHASE', 300.00, '2025-01-10', '2025-01-10')
+    fresh.add_transaction('PAYMENT', 150.00, '2025-02-10', '2025-02-10')
+    fresh.add_transaction('PURCHASE', 100.00, '2025-02-10', '2025-02-10')
+    fresh.add_transaction('REFUND', 50.00, '2025-02-15', '2025-02-15')
+    fresh.add_transaction('PURCHASE', 75.00, '2025-01-20', '2025-01-20')
+    fresh.add_transaction('PURCHASE', 40.00, '2024-12-20', '2024-12-20')
+
+    incremental = simulator_with_activity.statements[columns]
+    rebuilt = fresh.statements[columns]
+    assert len(incremental) == len(rebuilt)
+    assert incremental.equals(rebuilt)
+    for mine, theirs in zip(simulator_with_activity.statements['transactions'],
+                            fresh.statements['transactions']):
+        assert mine.equals(theirs)
+
+
+def test_reset_clears_state(simulator_with_activity):
+    """Test that reset empties transactions and statements"""
+    simulator_with_activity.reset()
+
+    assert simulator_with_activity.transactions.empty
+    assert simulator_with_activity.statements.empty
+
+
+def test_create_statement_extension(simulator_with_activity):
+    """Test that a statement extension credits the card and creates a product"""
+    ext_id = simulator_with_activity.create_statement_extension(
+        250.00, '2025-03-03', term_months=6)
+
+    assert ext_id == "EXT-0001"
+    transactions = simulator_with_activity.transactions
+    assert transactions.iloc[-1]['type'] == 'EXTENSION'
+    assert transactions.iloc[-1]['balance'] == 150.0
+
+    extension = simulator_with_activity.extension_factory.extensions[0]
+    assert extension.term_months == 6
+
+
+def test_batch_extension_payments(simulator_with_activity):
+    """Test batched payments across extensions with per-extension ordering"""
+    first = simulator_with_activity.create_statement_extension(
+        300.00, '2025-03-03', term_months=3)
+    second = simulator_with_activity.create_statement_extension(
+        120.00, '2025-03-10', term_months=2)
+
+    results = simulator_with_activity.batch_extension_payments([
+        (first, Decimal('50.00'), '2025-04-03'),
+        (second, Decimal('20.00'), '2025-04-10'),
+        (first, Decimal('25.00'), '2025-04-05'),
+        ('EXT-9999', Decimal('10.00'), '2025-04-03'),
+    ])
+
+    # Results line up with the input entries; unknown extensions yield None
+    assert len(results) == 4
+    assert results[3] is None
+    assert results[0]['payment_amount'] == Decimal('50.00')
+    assert results[1]['payment_amount'] == Decimal('20.00')
+    assert results[2]['payment_amount'] == Decimal('25.00')
+
+    # Payments to the same extension are applied in input order
+    ext = simulator_with_activity.extension_factory.get_extension(first)
+    assert ext.payments['payment_date'].tolist() == [
+        datetime.date(2025, 4, 3), datetime.date(2025, 4, 5)]
+    assert results[2]['remaining_balance'] < results[0]['remaining_balance']
+
+    other = simulator_with_activity.extension_factory.get_extension(second)
+    assert len(other.payments) == 1
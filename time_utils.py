@@ -1,6 +1,8 @@
 import datetime
+from functools import lru_cache
 
-holidays = [
+# frozenset gives O(1) membership checks in the business-day loop
+holidays = frozenset([
     datetime.date(2025, 1, 1),   # New Year's Day
     datetime.date(2025, 4, 18),  # Good Friday
     datetime.date(2025, 5, 19),  # Victoria Day
@@ -11,9 +13,10 @@ holidays = [
     datetime.date(2025, 11, 11),  # Remembrance Day
     datetime.date(2025, 12, 25),  # Christmas Day
     datetime.date(2025, 12, 26),  # Boxing Day
-]
+])
 
 
+@lru_cache(maxsize=4096)
 def add_business_days(date, days):
     """
     Add specified number of business days to a date, accounting for weekends and holidays.